@@ -146,39 +146,37 @@ fn path_matches_extension_filters<S: ::std::hash::BuildHasher>(
     p: &Path,
     filters: &HashSet<String, S>,
 ) -> bool {
-    let filename = p.file_name().and_then(|name| name.to_str()).unwrap_or("");
+    p.file_name()
+        .and_then(|name| name.to_str())
+        .is_some_and(|name| name_matches_extension_filters(name, filters))
+}
 
+/// Same as [`path_matches_extension_filters`], but on a bare file name so that
+/// directory scans can match straight from the entry name without building a path.
+fn name_matches_extension_filters<S: ::std::hash::BuildHasher>(
+    filename: &str,
+    filters: &HashSet<String, S>,
+) -> bool {
     if filename.is_empty() {
         return false;
     }
 
-    // 1. Try full filename as extension (for extensionless files like "justfile")
-    let full_filename_ext = format!(".{}", filename.to_lowercase());
-    if filters.contains(&full_filename_ext) {
-        return true;
-    }
-
-    // 2. Try multi-dot extensions (for files like "file.tar.gz")
-    let filename_lower = filename.to_lowercase();
-    let mut dot_pos = 0;
-    while let Some(pos) = filename_lower[dot_pos..].find('.') {
-        let actual_pos = dot_pos + pos;
-        let multi_ext = &filename_lower[actual_pos..];
-        if filters.contains(multi_ext) {
-            return true;
-        }
-        dot_pos = actual_pos + 1;
-    }
+    // Lowercase once into ".<filename>"; every candidate is a slice of it.
+    let mut dotted = String::with_capacity(filename.len() + 1);
+    dotted.push('.');
+    dotted.push_str(&filename.to_lowercase());
 
-    // 3. Try single extension (current behavior for files like "file.rs")
-    if let Some(ext) = p.extension().and_then(|e| e.to_str()) {
-        let single_ext = format!(".{}", ext.to_lowercase());
-        if filters.contains(&single_ext) {
-            return true;
-        }
+    // 1. Full filename as extension (for extensionless files like "justfile")
+    if filters.contains(dotted.as_str()) {
+        return true;
     }
 
-    false
+    // 2./3. Every dotted suffix: multi-dot extensions ("file.tar.gz") and,
+    // as the last one, the single extension ("file.rs")
+    dotted
+        .match_indices('.')
+        .skip(1)
+        .any(|(pos, _)| filters.contains(&dotted[pos..]))
 }
 
 #[derive(Default, Debug)]
@@ -201,7 +199,15 @@ pub fn scan_dir_to_node<S: ::std::hash::BuildHasher>(
     exclude_dirs: &HashSet<String, S>,
     exclude_files: &HashSet<String, S>,
 ) -> Node {
-    scan_dir_to_node_internal(dir, include_exts, exclude_exts, exclude_dirs, exclude_files).node
+    let mut stats = ScanStats::default();
+    scan_dir_to_node_internal(
+        dir,
+        include_exts,
+        exclude_exts,
+        exclude_dirs,
+        exclude_files,
+        &mut stats,
+    )
 }
 
 pub fn scan_dir_to_node_with_stats<S: ::std::hash::BuildHasher>(
@@ -211,7 +217,16 @@ pub fn scan_dir_to_node_with_stats<S: ::std::hash::BuildHasher>(
     exclude_dirs: &HashSet<String, S>,
     exclude_files: &HashSet<String, S>,
 ) -> ScanResult {
-    scan_dir_to_node_internal(dir, include_exts, exclude_exts, exclude_dirs, exclude_files)
+    let mut stats = ScanStats::default();
+    let node = scan_dir_to_node_internal(
+        dir,
+        include_exts,
+        exclude_exts,
+        exclude_dirs,
+        exclude_files,
+        &mut stats,
+    );
+    ScanResult { node, stats }
 }
 
 fn scan_dir_to_node_internal<S: ::std::hash::BuildHasher>(
@@ -220,7 +235,8 @@ fn scan_dir_to_node_internal<S: ::std::hash::BuildHasher>(
     exclude_exts: &HashSet<String, S>,
     exclude_dirs: &HashSet<String, S>,
     exclude_files: &HashSet<String, S>,
-) -> ScanResult {
+    stats: &mut ScanStats,
+) -> Node {
     let name = dir
         .file_name()
         .unwrap_or_default()
@@ -236,8 +252,16 @@ fn scan_dir_to_node_internal<S: ::std::hash::BuildHasher>(
         has_children: false,
     };
 
-    let (mut files, mut dirs, mut stats) =
-        gather_dir_entries(dir, include_exts, exclude_exts, exclude_dirs, exclude_files);
+    // A single stats accumulator is threaded through the whole walk, so nothing
+    // is merged back level by level.
+    let (mut files, mut dirs) = gather_dir_entries(
+        dir,
+        include_exts,
+        exclude_exts,
+        exclude_dirs,
+        exclude_files,
+        stats,
+    );
 
     files.sort_by(|a, b| a.0.cmp(&b.0));
     dirs.sort_by(|a, b| a.0.cmp(&b.0));
@@ -258,24 +282,15 @@ fn scan_dir_to_node_internal<S: ::std::hash::BuildHasher>(
 
     let include_mode = !include_exts.is_empty();
     for (_basename, path) in dirs {
-        let ScanResult {
-            node: child,
-            stats: mut child_stats,
-        } = scan_dir_to_node_internal(
+        let child = scan_dir_to_node_internal(
             &path,
             include_exts,
             exclude_exts,
             exclude_dirs,
             exclude_files,
+            stats,
         );
 
-        stats
-            .excluded_dirs_found
-            .extend(child_stats.excluded_dirs_found.drain());
-        stats
-            .excluded_files_found
-            .extend(child_stats.excluded_files_found.drain());
-
         let child_visible = if include_mode {
             !child.children.is_empty() || child.has_children
         } else {
@@ -289,7 +304,7 @@ fn scan_dir_to_node_internal<S: ::std::hash::BuildHasher>(
         }
     }
 
-    ScanResult { node, stats }
+    node
 }
 
 fn gather_dir_entries<S: ::std::hash::BuildHasher>(
@@ -298,21 +313,21 @@ fn gather_dir_entries<S: ::std::hash::BuildHasher>(
     exclude_exts: &HashSet<String, S>,
     exclude_dirs: &HashSet<String, S>,
     exclude_files: &HashSet<String, S>,
-) -> (Vec<NamePath>, Vec<NamePath>, ScanStats) {
+    stats: &mut ScanStats,
+) -> (Vec<NamePath>, Vec<NamePath>) {
     let Ok(entries) = fs::read_dir(dir) else {
-        return (Vec::new(), Vec::new(), ScanStats::default());
+        return (Vec::new(), Vec::new());
     };
 
     let mut dirs: Vec<NamePath> = Vec::new();
     let mut files: Vec<NamePath> = Vec::new();
-    let mut stats = ScanStats::default();
 
     let include_mode = !include_exts.is_empty();
     let exclude_mode = !exclude_exts.is_empty();
 
     for ent in entries.flatten() {
-        let path = ent.path();
-        let base: String = ent.file_name().to_string_lossy().into_owned();
+        let file_name = ent.file_name();
+        let base: String = file_name.to_string_lossy().into_owned();
 
         let is_dir = ent.file_type().map(|ft| ft.is_dir()).unwrap_or(false);
         if is_dir {
@@ -320,7 +335,7 @@ fn gather_dir_entries<S: ::std::hash::BuildHasher>(
                 stats.excluded_dirs_found.insert(base);
                 continue;
             }
-            dirs.push((base, path));
+            dirs.push((base, ent.path()));
             continue;
         }
 
@@ -329,22 +344,21 @@ fn gather_dir_entries<S: ::std::hash::BuildHasher>(
             continue;
         }
 
-        let matches_file = if include_mode || exclude_mode {
-            if include_mode {
-                path_matches_extension_filters(&path, include_exts)
-            } else {
-                !path_matches_extension_filters(&path, exclude_exts)
-            }
+        let name = file_name.to_str();
+        let matches_file = if include_mode {
+            name.is_some_and(|n| name_matches_extension_filters(n, include_exts))
+        } else if exclude_mode {
+            !name.is_some_and(|n| name_matches_extension_filters(n, exclude_exts))
         } else {
             true
         };
 
         if matches_file {
-            files.push((base, path));
+            files.push((base, ent.path()));
         }
     }
 
-    (files, dirs, stats)
+    (files, dirs)
 }
 
 #[must_use]
@@ -361,6 +375,79 @@ fn gather_paths_set_rec(n: &Node, set: &mut HashSet<PathBuf>) {
     }
 }
 
+/// Directories the user has collapsed.
+///
+/// Scans always produce fully expanded trees, so this is captured before a
+/// rescan and restored afterwards with [`apply_collapsed_dirs`]; collapsed
+/// subtrees then stay out of the row model.
+#[must_use]
+pub fn collect_collapsed_dirs(root: &Node) -> HashSet<PathBuf> {
+    let mut set = HashSet::new();
+    let mut stack = vec![root];
+    while let Some(n) = stack.pop() {
+        if n.is_dir && !n.expanded {
+            set.insert(n.path.clone());
+        }
+        stack.extend(n.children.iter().filter(|c| c.is_dir));
+    }
+    set
+}
+
+pub fn apply_collapsed_dirs<S: ::std::hash::BuildHasher>(
+    root: &mut Node,
+    collapsed: &HashSet<PathBuf, S>,
+) {
+    if collapsed.is_empty() {
+        return;
+    }
+    let mut stack = vec![root];
+    while let Some(n) = stack.pop() {
+        if n.is_dir && collapsed.contains(&n.path) {
+            n.expanded = false;
+        }
+        stack.extend(n.children.iter_mut().filter(|c| c.is_dir));
+    }
+}
+
+/// Files under `root` whose `/`-separated relative path is in `wanted`.
+///
+/// Only directories that are a `/`-prefix of some wanted path are entered, so
+/// the walk never visits the rest of the project. Prefixes are derived from
+/// the wanted keys themselves, which keeps flat lists (`src/core/fs.rs` with
+/// no `src` line) working as well as full pasted trees.
+#[must_use]
+pub fn collect_wanted_files<S: ::std::hash::BuildHasher>(
+    root: &Node,
+    wanted: &HashSet<String, S>,
+) -> Vec<PathBuf> {
+    let dirs: HashSet<&str> = wanted
+        .iter()
+        .flat_map(|rel| rel.match_indices('/').map(move |(i, _)| &rel[..i]))
+        .collect();
+
+    let mut out = Vec::new();
+    let mut stack: Vec<(&Node, String)> = vec![(root, String::new())];
+    let mut key = String::new();
+    while let Some((dir, rel)) = stack.pop() {
+        for child in &dir.children {
+            key.clear();
+            if !rel.is_empty() {
+                key.push_str(&rel);
+                key.push('/');
+            }
+            key.push_str(&child.name);
+            if child.is_dir {
+                if dirs.contains(key.as_str()) {
+                    stack.push((child, key.clone()));
+                }
+            } else if wanted.contains(&key) {
+                out.push(child.path.clone());
+            }
+        }
+    }
+    out
+}
+
 #[must_use]
 pub const fn dir_contains_file(node: &Node) -> bool {
     !node.is_dir || node.has_children
@@ -372,6 +459,35 @@ pub fn collect_selected_paths<T: ::std::hash::BuildHasher>(
     inherited: Option<bool>,
     files_out: &mut Vec<PathBuf>,
     dirs_out: &mut Vec<PathBuf>,
+) {
+    // Every strict ancestor of an explicit entry. A subtree outside this set only
+    // inherits its parent's state, so an unselected one cannot contribute anything
+    // and is skipped instead of walked.
+    let mut overridden_below: HashSet<&Path> = HashSet::new();
+    for p in explicit.keys() {
+        for anc in p.ancestors().skip(1) {
+            if !overridden_below.insert(anc) {
+                break;
+            }
+        }
+    }
+    collect_selected_paths_rec(
+        node,
+        explicit,
+        &overridden_below,
+        inherited,
+        files_out,
+        dirs_out,
+    );
+}
+
+fn collect_selected_paths_rec<T: ::std::hash::BuildHasher>(
+    node: &Node,
+    explicit: &HashMap<PathBuf, bool, T>,
+    overridden_below: &HashSet<&Path>,
+    inherited: Option<bool>,
+    files_out: &mut Vec<PathBuf>,
+    dirs_out: &mut Vec<PathBuf>,
 ) {
     let my_effective = explicit
         .get(&node.path)
@@ -383,9 +499,19 @@ pub fn collect_selected_paths<T: ::std::hash::BuildHasher>(
         if my_effective && node.has_children {
             dirs_out.push(node.path.clone());
         }
+        if !my_effective && !overridden_below.contains(node.path.as_path()) {
+            return;
+        }
         let next_inherited = my_effective;
         for c in &node.children {
-            collect_selected_paths(c, explicit, Some(next_inherited), files_out, dirs_out);
+            collect_selected_paths_rec(
+                c,
+                explicit,
+                overridden_below,
+                Some(next_inherited),
+                files_out,
+                dirs_out,
+            );
         }
     } else if my_effective {
         files_out.push(node.path.clone());
@@ -401,6 +527,21 @@ pub fn drain_channel_nonblocking<T>(rx: &std::sync::mpsc::Receiver<T>) -> bool {
     any
 }
 
+/// Whether a filesystem event can change the shape of the tree.
+///
+/// Content and metadata changes of existing entries cannot, so they only need
+/// the output regenerated. Anything else (create, remove, rename, or a kind the
+/// backend could not classify) requires a rescan.
+#[must_use]
+pub const fn is_structural_event_kind(kind: &notify::EventKind) -> bool {
+    use notify::event::ModifyKind;
+    !matches!(
+        kind,
+        notify::EventKind::Access(_)
+            | notify::EventKind::Modify(ModifyKind::Data(_) | ModifyKind::Metadata(_))
+    )
+}
+
 #[must_use]
 pub fn is_event_path_relevant<S: ::std::hash::BuildHasher>(
     project_root: &std::path::Path,
@@ -71,6 +71,16 @@ pub struct RustFilterOptions {
     pub function_signatures_only: bool,
 }
 
+impl RustFilterOptions {
+    /// True when at least one filter would transform the source.
+    #[must_use]
+    pub const fn is_active(&self) -> bool {
+        self.remove_inline_regular_comments
+            || self.remove_doc_comments
+            || self.function_signatures_only
+    }
+}
+
 /// Returns true if the given path ends with ".rs" (case-sensitive like Rust filenames on most systems).
 #[must_use]
 pub fn is_rust_file_path(path: &std::path::Path) -> bool {
@@ -81,10 +91,7 @@ pub fn is_rust_file_path(path: &std::path::Path) -> bool {
 /// This function only transforms when at least one option is enabled; otherwise returns input as-is.
 #[must_use]
 pub fn apply_rust_filters(source: &str, opts: &RustFilterOptions) -> String {
-    if !(opts.remove_inline_regular_comments
-        || opts.remove_doc_comments
-        || opts.function_signatures_only)
-    {
+    if !opts.is_active() {
         return source.to_string();
     }
 
@@ -4,6 +4,14 @@ pub struct SlintFilterOptions {
     pub remove_block_comments: bool,
 }
 
+impl SlintFilterOptions {
+    /// True when at least one filter would transform the source.
+    #[must_use]
+    pub const fn is_active(&self) -> bool {
+        self.remove_line_comments || self.remove_block_comments
+    }
+}
+
 /// Returns true if the given path ends with ".slint" (case-sensitive like most filesystems).
 #[must_use]
 pub fn is_slint_file_path(path: &std::path::Path) -> bool {
@@ -15,7 +23,7 @@ pub fn is_slint_file_path(path: &std::path::Path) -> bool {
 #[must_use]
 #[allow(clippy::too_many_lines, clippy::items_after_statements)]
 pub fn apply_slint_filters(source: &str, opts: &SlintFilterOptions) -> String {
-    if !(opts.remove_line_comments || opts.remove_block_comments) {
+    if !opts.is_active() {
         return source.to_string();
     }
 
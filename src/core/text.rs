@@ -19,8 +19,8 @@ pub const GLYPH_HOURGLASS: &str = "⏳";
 
 // No encoding repair needed for hierarchy or file contents when read correctly as UTF-8.
 #[inline]
-fn normalize_mojibake_tree_input(input: &str) -> String {
-    input.to_string()
+const fn normalize_mojibake_tree_input(input: &str) -> &str {
+    input
 }
 
 #[must_use]
@@ -32,12 +32,14 @@ pub fn repair_mojibake_if_present(input: &str) -> String {
 
 #[must_use]
 pub fn parse_hierarchy_text(text: &str) -> Option<HashSet<String>> {
-    let normalized_input = normalize_mojibake_tree_input(text);
-    let mut lines = normalized_input.lines();
+    let mut lines = normalize_mojibake_tree_input(text).lines();
     let _root = lines.next()?;
 
     let mut paths: HashSet<String> = HashSet::new();
-    let mut parts: Vec<String> = Vec::new();
+    // Current relative path, plus the byte length it had after each level, so
+    // moving back up the tree is a truncate rather than a re-join of all parts.
+    let mut rel = String::new();
+    let mut level_ends: Vec<usize> = Vec::new();
 
     for raw in lines {
         let line = raw.trim_end();
@@ -77,13 +79,17 @@ pub fn parse_hierarchy_text(text: &str) -> Option<HashSet<String>> {
             continue;
         }
 
-        if parts.len() > level {
-            parts.truncate(level);
+        if level_ends.len() > level {
+            level_ends.truncate(level);
+            rel.truncate(level_ends.last().copied().unwrap_or(0));
+        }
+        if !level_ends.is_empty() {
+            rel.push('/');
         }
-        parts.push(name.to_string());
+        rel.push_str(name);
+        level_ends.push(rel.len());
 
-        let rel = parts.join("/");
-        paths.insert(rel);
+        paths.insert(rel.clone());
     }
 
     Some(paths)
@@ -99,49 +105,27 @@ pub fn split_prefix_list(raw: &str) -> Vec<String> {
 
 #[must_use]
 pub fn render_unicode_tree_from_paths(paths: &[String], root_name: Option<&str>) -> String {
+    // Nodes live in one arena and map child names to arena indices, so a
+    // lookup never holds a borrow across the insert: existing components cost
+    // a single lookup, and an owned key is only allocated for a new one.
     #[derive(Default)]
     struct T {
-        children: BTreeMap<String, Box<T>>,
-    }
-    fn insert_path(root: &mut T, parts: &[&str]) {
-        if parts.is_empty() {
-            return;
-        }
-        let entry = root.children.entry(parts[0].to_string()).or_default();
-        if parts.len() > 1 {
-            insert_path(entry, &parts[1..]);
-        }
-    }
-    fn render(node: &T, prefix: &mut String, out: &mut String) {
-        let len = node.children.len();
-        for (idx, (name, child)) in node.children.iter().enumerate() {
-            let last = idx + 1 == len;
-            out.push_str(prefix);
-            out.push_str(if last {
-                GLYPH_BRANCH_END
-            } else {
-                GLYPH_BRANCH_TEE
-            });
-            out.push_str(name);
-            out.push('\n');
-
-            if !child.children.is_empty() {
-                let saved = prefix.len();
-                prefix.push_str(if last {
-                    GLYPH_INDENT
-                } else {
-                    GLYPH_VERT_PREFIX
-                });
-                render(child, prefix, out);
-                prefix.truncate(saved);
-            }
-        }
+        children: BTreeMap<String, usize>,
     }
 
-    let mut root = T::default();
+    let mut nodes = vec![T::default()];
     for p in paths {
-        let parts: Vec<&str> = p.split('/').filter(|s| !s.is_empty()).collect();
-        insert_path(&mut root, &parts);
+        let mut cur = 0;
+        for part in p.split('/').filter(|s| !s.is_empty()) {
+            cur = if let Some(&child) = nodes[cur].children.get(part) {
+                child
+            } else {
+                let child = nodes.len();
+                nodes.push(T::default());
+                nodes[cur].children.insert(part.to_owned(), child);
+                child
+            };
+        }
     }
 
     let mut out = String::new();
@@ -149,8 +133,38 @@ pub fn render_unicode_tree_from_paths(paths: &[String], root_name: Option<&str>)
         out.push_str(name);
         out.push('\n');
     }
+    // Depth-first with an explicit stack of sibling iterators, so rendering
+    // does not recurse once per directory level. Each entry also records the
+    // prefix length for its level; `prefix` is shared and truncated back.
     let mut prefix = String::new();
-    render(&root, &mut prefix, &mut out);
+    let mut stack = vec![(nodes[0].children.iter().peekable(), 0usize)];
+    while let Some((siblings, level_len)) = stack.last_mut() {
+        let Some((name, &child)) = siblings.next() else {
+            stack.pop();
+            continue;
+        };
+        let last = siblings.peek().is_none();
+        prefix.truncate(*level_len);
+
+        out.push_str(&prefix);
+        out.push_str(if last {
+            GLYPH_BRANCH_END
+        } else {
+            GLYPH_BRANCH_TEE
+        });
+        out.push_str(name);
+        out.push('\n');
+
+        let child = &nodes[child];
+        if !child.children.is_empty() {
+            prefix.push_str(if last {
+                GLYPH_INDENT
+            } else {
+                GLYPH_VERT_PREFIX
+            });
+            stack.push((child.children.iter().peekable(), prefix.len()));
+        }
+    }
     out
 }
 
@@ -10,7 +10,7 @@ use slint::ComponentHandle;
 #[cfg(feature = "ui")]
 use ui::{
     AppState, AppWindow, Row, SelectFromTextDialog, apply_selection_from_text, on_check_updates,
-    on_copy_output, on_filter_changed, on_generate_output, on_save_profile_as,
+    on_copy_output, on_filter_changed, on_filter_toggled, on_generate_output, on_save_profile_as,
     on_save_profile_current, on_select_folder, on_select_profile, on_toggle_check,
     on_toggle_expand, on_toggle_fs_watcher,
 };
@@ -99,6 +99,15 @@ fn wire_browser_handlers(app: &AppWindow, state: &Rc<RefCell<AppState>>) {
             }
         });
     }
+    {
+        let app_weak = app.as_weak();
+        let state = Rc::clone(state);
+        app.on_filter_toggled(move || {
+            if let Some(app) = app_weak.upgrade() {
+                on_filter_toggled(&app, &state);
+            }
+        });
+    }
     {
         let app_weak = app.as_weak();
         let state = Rc::clone(state);
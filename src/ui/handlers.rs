@@ -1,5 +1,7 @@
 use super::{AppWindow, Row};
-use crate::ui::state::{CommentRemoval, SharedState};
+use crate::ui::state::{
+    CommentRemoval, GenerationOutcome, RescanOutcome, SharedState, TreeFilters,
+};
 use chrono::Local;
 use slint::{ComponentHandle, Model, ModelRc, VecModel};
 use std::{
@@ -14,39 +16,25 @@ use std::sync::mpsc;
 
 use stitch::core::{
     Node, Profile, ProfileScope, RustFilterOptions, RustOptions, SlintOptions, WorkspaceSettings,
-    apply_rust_filters, apply_slint_filters, clean_remove_regex, collapse_consecutive_blank_lines,
-    collect_selected_paths, compile_remove_regex_opt, delete_profile, ensure_profiles_dirs,
-    ensure_workspace_dir, gather_paths_set, is_ancestor_of, is_rust_file_path, is_slint_file_path,
-    list_profiles, load_local_settings, load_profile, load_workspace, parse_extension_filters,
+    apply_collapsed_dirs, apply_rust_filters, apply_slint_filters, clean_remove_regex,
+    collapse_consecutive_blank_lines, collect_collapsed_dirs, collect_selected_paths,
+    collect_wanted_files, compile_remove_regex_opt, delete_profile, ensure_profiles_dirs,
+    ensure_workspace_dir, gather_paths_set, is_rust_file_path, is_slint_file_path, list_profiles,
+    load_local_settings, load_profile, load_workspace, parse_extension_filters,
     parse_hierarchy_text, path_to_unix, render_unicode_tree_from_paths, save_local_settings,
     save_profile, save_workspace, scan_dir_to_node_with_stats, signatures_filter_matches,
     split_prefix_list,
 };
 
-fn walk_and_mark(
-    node: &Node,
-    project_root: &Path,
-    wanted: &std::collections::HashSet<String>,
-    explicit: &mut HashMap<PathBuf, bool>,
-) {
-    if node.is_dir {
-        for c in &node.children {
-            walk_and_mark(c, project_root, wanted, explicit);
-        }
-    } else if let Ok(rel) = node.path.strip_prefix(project_root) {
-        let key = rel
-            .iter()
-            .map(|c| c.to_string_lossy())
-            .collect::<Vec<_>>()
-            .join("/");
-        if wanted.contains(&key) {
-            explicit.insert(node.path.clone(), true);
-        }
-    }
-}
-
 const UI_OUTPUT_CHAR_LIMIT: usize = 50_000;
 
+/// Bytes added around each file's contents by the start/end markers (without the path).
+const SECTION_MARKERS_LEN: usize =
+    "--- Start of file:  ---\n".len() + "\n".len() + "--- End of file:  ---\n\n".len();
+
+/// Quiet period after the last filter edit before the tree is rescanned.
+const FILTER_DEBOUNCE_MS: u64 = 250;
+
 #[cfg(feature = "tokens")]
 const MAX_TOKENIZE_BYTES: usize = 16 * 1024 * 1024;
 
@@ -71,7 +59,7 @@ struct GenerationJob {
     rust_opts: RustFilterOptions,
     rust_sig_filter: String,
     slint_opts: stitch::core::SlintFilterOptions,
-    tx: mpsc::Sender<(u64, String)>,
+    tx: mpsc::Sender<GenerationOutcome>,
     seq: u64,
 }
 
@@ -90,30 +78,34 @@ struct NotesContext {
     slint_remove_block_comments: bool,
 }
 
-struct SelectedPresence {
-    entries: std::collections::BTreeSet<String>,
+/// Borrowed view of the selected relative paths; the notes only ask membership
+/// questions of it, so the paths are neither copied nor sorted.
+struct SelectedPresence<'a> {
+    entries: &'a [String],
 }
 
 fn profile_vec_index(idx: i32) -> Option<usize> {
     usize::try_from(idx).ok().and_then(|i| i.checked_sub(1))
 }
 
-impl SelectedPresence {
-    fn new(paths: &[String]) -> Self {
-        let entries = paths.iter().cloned().collect();
+impl<'a> SelectedPresence<'a> {
+    const fn new(entries: &'a [String]) -> Self {
         Self { entries }
     }
 
     fn collect_present_extensions(&self, filters: &HashSet<String>) -> Vec<String> {
         let mut present = std::collections::BTreeSet::new();
-        for rel in &self.entries {
+        let mut dot = String::new();
+        for rel in self.entries {
             if let Some(ext) = std::path::Path::new(rel)
                 .extension()
                 .and_then(|e| e.to_str())
             {
-                let dot = format!(".{}", ext.to_lowercase());
-                if filters.contains(&dot) {
-                    present.insert(dot);
+                dot.clear();
+                dot.push('.');
+                dot.extend(ext.chars().flat_map(char::to_lowercase));
+                if filters.contains(&dot) && !present.contains(&dot) {
+                    present.insert(dot.clone());
                 }
             }
         }
@@ -148,27 +140,37 @@ impl SelectedPresence {
 /* =============================== UI Actions =============================== */
 
 pub fn apply_selection_from_text(app: &AppWindow, state: &SharedState, text: &str) {
-    let (root_opt, selected_dir_opt) = {
+    {
         let s = state.borrow();
-        (s.root_node.clone(), s.selected_directory.clone())
-    };
-    let (Some(root), Some(selected_dir)) = (root_opt, selected_dir_opt) else {
-        return;
-    };
+        if s.root_node.is_none() || s.selected_directory.is_none() {
+            return;
+        }
+    }
 
     let wanted = match parse_hierarchy_text(text) {
         Some(s) if !s.is_empty() => s,
         _ => return,
     };
 
-    {
-        let mut s = state.borrow_mut();
-        s.explicit_states.clear();
-    }
-
-    {
-        let mut s = state.borrow_mut();
-        walk_and_mark(&root, &selected_dir, &wanted, &mut s.explicit_states);
+    let changed = {
+        let mut guard = state.borrow_mut();
+        let s = &mut *guard;
+        let mut explicit = HashMap::new();
+        if let Some(root) = s.root_node.as_ref() {
+            explicit.extend(
+                collect_wanted_files(root, &wanted)
+                    .into_iter()
+                    .map(|p| (p, true)),
+            );
+        }
+        let changed = explicit != s.explicit_states;
+        s.explicit_states = explicit;
+        changed
+    };
+    // Re-applying the current selection would rebuild every row and regenerate
+    // the same output.
+    if !changed {
+        return;
     }
 
     refresh_flat_model(app, state);
@@ -183,6 +185,10 @@ pub fn on_select_folder(app: &AppWindow, state: &SharedState) {
         {
             let mut s = state.borrow_mut();
             s.selected_directory = Some(dir.clone());
+            // Drop the previous project's tree so nothing from it (such as its
+            // collapsed directories) carries over into the new one.
+            s.root_node = None;
+            s.path_snapshot = None;
             s.explicit_states.clear();
             s.last_mod_times.clear();
             s.fs.dirty = true;
@@ -270,8 +276,39 @@ pub fn on_select_folder(app: &AppWindow, state: &SharedState) {
 }
 
 pub fn on_filter_changed(app: &AppWindow, state: &SharedState) {
+    // Every keystroke lands here; restarting the single-shot timer means only
+    // the last edit of a burst triggers the rescan.
+    let app_weak = app.as_weak();
+    let state_weak = std::rc::Rc::downgrade(state);
+    state.borrow().filter_debounce_timer.start(
+        slint::TimerMode::SingleShot,
+        std::time::Duration::from_millis(FILTER_DEBOUNCE_MS),
+        move || {
+            if let (Some(app), Some(state)) = (app_weak.upgrade(), state_weak.upgrade()) {
+                apply_filter_change(&app, &state);
+            }
+        },
+    );
+}
+
+/// Filter option checkboxes: a click is a single discrete edit, so apply it now
+/// (together with any text edit still waiting on the debounce).
+pub fn on_filter_toggled(app: &AppWindow, state: &SharedState) {
+    state.borrow().filter_debounce_timer.stop();
+    apply_filter_change(app, state);
+}
+
+fn apply_filter_change(app: &AppWindow, state: &SharedState) {
     parse_filters_from_ui(app, state);
-    rebuild_tree_and_ui(app, state);
+
+    let tree_unaffected = {
+        let s = state.borrow();
+        s.root_node.is_some() && s.scanned_filters.as_ref().is_some_and(|f| f.matches(&s))
+    };
+    if !tree_unaffected {
+        rescan_tree_and_ui(app, state);
+    }
+
     on_generate_output(app, state);
     update_last_refresh(app);
 }
@@ -350,19 +387,23 @@ pub fn on_generate_output(app: &AppWindow, state: &SharedState) {
             return;
         }
         Err(SelectionError::NoItems) => {
+            state.borrow_mut().last_mod_times.clear();
             set_output(app, state, NO_ITEMS_SELECTED);
             update_last_refresh(app);
             return;
         }
     };
 
-    if !want_dirs_only {
-        update_last_mod_times(state, &selection.files);
-    }
-
     let header = build_hierarchy_header(state, &selection, disable_notes);
 
     if hierarchy_only || want_dirs_only {
+        // A full generation records modification times from the worker as it
+        // reads each file; nothing is read here, so stat on this thread.
+        if want_dirs_only {
+            state.borrow_mut().last_mod_times.clear();
+        } else {
+            update_last_mod_times(state, &selection.files);
+        }
         set_output(app, state, &header);
         update_last_refresh(app);
         return;
@@ -442,8 +483,11 @@ fn collect_selection_snapshot(
     })
 }
 
+/// Record the mtimes of exactly `files`, the current selection, so change
+/// detection never stats (or trips over) files that are no longer selected.
 fn update_last_mod_times(state: &SharedState, files: &[PathBuf]) {
     let mut s = state.borrow_mut();
+    s.last_mod_times.clear();
     for fp in files {
         let mtime = fs::metadata(fp).ok().and_then(|m| m.modified().ok());
         s.last_mod_times.insert(fp.clone(), mtime);
@@ -489,6 +533,15 @@ fn prepare_async_generation(
     );
     app.set_output_stats("".into());
 
+    // The worker reports real mtimes when it finishes. Until then, track the
+    // new selection with unknown times, so a save landing in between still
+    // reads as a change instead of going unnoticed.
+    state.borrow_mut().last_mod_times = selection
+        .files
+        .iter()
+        .map(|fp| (fp.clone(), None))
+        .collect();
+
     ensure_generation_channel(app, state);
     let job = build_generation_job(state, selection, header);
     spawn_generation_worker(job);
@@ -500,7 +553,7 @@ fn ensure_generation_channel(app: &AppWindow, state: &SharedState) {
         return;
     }
 
-    let (tx, rx) = mpsc::channel::<(u64, String)>();
+    let (tx, rx) = mpsc::channel::<GenerationOutcome>();
     s.gen_result_tx = Some(tx);
     s.gen_result_rx = Some(rx);
 
@@ -510,9 +563,10 @@ fn ensure_generation_channel(app: &AppWindow, state: &SharedState) {
         slint::TimerMode::Repeated,
         std::time::Duration::from_millis(120),
         move || {
-            if let (Some(app), Some(out)) = (app_weak.upgrade(), drain_latest_result(&state_rc)) {
-                #[allow(clippy::print_stdout)]
-                set_output(&app, &state_rc, &out);
+            if let (Some(app), Some(outcome)) = (app_weak.upgrade(), drain_latest_result(&state_rc))
+            {
+                state_rc.borrow_mut().last_mod_times = outcome.mod_times.into_iter().collect();
+                set_output(&app, &state_rc, &outcome.output);
                 update_last_refresh(&app);
 
                 let rerun = {
@@ -531,16 +585,12 @@ fn ensure_generation_channel(app: &AppWindow, state: &SharedState) {
     );
 }
 
-fn drain_latest_result(state: &SharedState) -> Option<String> {
-    let mut last: Option<(u64, String)> = None;
+fn drain_latest_result(state: &SharedState) -> Option<GenerationOutcome> {
     let guard = state.borrow();
-    if let Some(rx) = guard.gen_result_rx.as_ref() {
-        while let Ok(msg) = rx.try_recv() {
-            last = Some(msg);
-        }
-    }
-    drop(guard);
-    last.map(|(_, s)| s)
+    guard
+        .gen_result_rx
+        .as_ref()
+        .and_then(|rx| rx.try_iter().max_by_key(|outcome| outcome.seq))
 }
 
 fn build_generation_job(
@@ -626,7 +676,9 @@ fn run_generation_job(job: GenerationJob) {
     } = job;
 
     let mut skipped: Vec<(PathBuf, std::io::Error)> = Vec::new();
-    let mut file_sections = String::new();
+    // (display path, filtered contents); written out once the total size is known
+    let mut sections: Vec<(String, String)> = Vec::with_capacity(files.len());
+    let mut mod_times = Vec::with_capacity(files.len());
 
     for fp in files {
         let rel: PathBuf = fp.strip_prefix(&selected_dir).map_or_else(
@@ -634,10 +686,14 @@ fn run_generation_job(job: GenerationJob) {
             std::path::Path::to_path_buf,
         );
 
-        let mut contents = match fs::read_to_string(&fp) {
+        // Take the modification time from the handle the contents are read
+        // through, so the UI thread never stats the selection itself.
+        let (read, mtime) = read_file_with_mtime(&fp);
+        mod_times.push((fp.clone(), mtime));
+        let mut contents = match read {
             Ok(s) => s,
             Err(e) => {
-                skipped.push((fp.clone(), e));
+                skipped.push((fp, e));
                 continue;
             }
         };
@@ -648,31 +704,37 @@ fn run_generation_job(job: GenerationJob) {
             contents = stitch::core::strip_lines_and_inline_comments(&contents, &remove_prefixes);
         }
         if let Some(rr) = &remove_regex {
-            contents = rr.replace_all(&contents, "").to_string();
+            // `replace_all` borrows when nothing matched; only take over an owned result.
+            let replaced = match rr.replace_all(&contents, "") {
+                std::borrow::Cow::Owned(s) => Some(s),
+                std::borrow::Cow::Borrowed(_) => None,
+            };
+            if let Some(s) = replaced {
+                contents = s;
+            }
         }
 
-        if is_rust_file_path(&fp) {
-            let rel_for_match = rel
-                .iter()
-                .map(|c| c.to_string_lossy())
-                .collect::<Vec<_>>()
-                .join("/");
+        // The language filters return a copy even when disabled, so skip the call.
+        if rust_opts.is_active() && is_rust_file_path(&fp) {
             let mut eff = rust_opts.clone();
-            if !rust_sig_filter.trim().is_empty()
-                && !signatures_filter_matches(&rel_for_match, &rust_sig_filter)
-            {
-                eff.function_signatures_only = false;
+            if !rust_sig_filter.trim().is_empty() {
+                let rel_for_match = rel
+                    .iter()
+                    .map(|c| c.to_string_lossy())
+                    .collect::<Vec<_>>()
+                    .join("/");
+                if !signatures_filter_matches(&rel_for_match, &rust_sig_filter) {
+                    eff.function_signatures_only = false;
+                }
+            }
+            if eff.is_active() {
+                contents = apply_rust_filters(&contents, &eff);
             }
-            contents = apply_rust_filters(&contents, &eff);
-        } else if is_slint_file_path(&fp) {
+        } else if slint_opts.is_active() && is_slint_file_path(&fp) {
             contents = apply_slint_filters(&contents, &slint_opts);
         }
 
-        let rel_display = rel.to_string_lossy().into_owned();
-        let _ = writeln!(file_sections, "--- Start of file: {rel_display} ---");
-        file_sections.push_str(&contents);
-        file_sections.push('\n');
-        let _ = writeln!(file_sections, "--- End of file: {rel_display} ---\n");
+        sections.push((rel.to_string_lossy().into_owned(), contents));
     }
     // Merge skipped file notes into the existing NOTES section within the header
     let mut final_header = header;
@@ -696,9 +758,40 @@ fn run_generation_job(job: GenerationJob) {
     }
 
     final_header.push_str("\n=== FILE CONTENTS ===\n\n");
-    let mut out = final_header;
-    out.push_str(&file_sections);
-    let _ = tx.send((seq, out));
+
+    // Size the output up front so the whole document is written into a single
+    // allocation instead of growing (and re-copying) as sections are appended.
+    let sections_len: usize = sections
+        .iter()
+        .map(|(rel, contents)| contents.len() + 2 * rel.len() + SECTION_MARKERS_LEN)
+        .sum();
+    let mut output = String::with_capacity(final_header.len() + sections_len);
+    output.push_str(&final_header);
+    for (rel_display, contents) in &sections {
+        let _ = writeln!(output, "--- Start of file: {rel_display} ---");
+        output.push_str(contents);
+        output.push('\n');
+        let _ = writeln!(output, "--- End of file: {rel_display} ---\n");
+    }
+    let _ = tx.send(GenerationOutcome {
+        seq,
+        output,
+        mod_times,
+    });
+}
+
+fn read_file_with_mtime(path: &Path) -> (std::io::Result<String>, Option<std::time::SystemTime>) {
+    use std::io::Read;
+
+    let mut file = match fs::File::open(path) {
+        Ok(f) => f,
+        Err(e) => return (Err(e), None),
+    };
+    let meta = file.metadata().ok();
+    let mtime = meta.as_ref().and_then(|m| m.modified().ok());
+    let size = meta.map_or(0, |m| usize::try_from(m.len()).unwrap_or(0));
+    let mut contents = String::with_capacity(size);
+    (file.read_to_string(&mut contents).map(|_| contents), mtime)
 }
 
 fn note_excluded_dirs(ctx: &NotesContext, _selected: &SelectedPresence) -> Option<String> {
@@ -926,6 +1019,10 @@ pub fn on_copy_output(app: &AppWindow, state: &SharedState) {
 
 pub fn rebuild_tree_and_ui(app: &AppWindow, state: &SharedState) {
     parse_filters_from_ui(app, state);
+    rescan_tree_and_ui(app, state);
+}
+
+fn rescan_tree_and_ui(app: &AppWindow, state: &SharedState) {
     {
         let s = state.borrow();
         if s.selected_directory.is_none() {
@@ -936,12 +1033,17 @@ pub fn rebuild_tree_and_ui(app: &AppWindow, state: &SharedState) {
     {
         let (root, snapshot, scan_stats) = {
             let s = state.borrow();
-            let dir = s.selected_directory.as_ref().unwrap().clone();
-            let include = s.include_exts.clone();
-            let exclude = s.exclude_exts.clone();
-            let ex_dirs = s.exclude_dirs.clone();
-            let ex_files = s.exclude_files.clone();
-            let scan = scan_dir_to_node_with_stats(&dir, &include, &exclude, &ex_dirs, &ex_files);
+            let dir = s.selected_directory.as_ref().unwrap();
+            let mut scan = scan_dir_to_node_with_stats(
+                dir,
+                &s.include_exts,
+                &s.exclude_exts,
+                &s.exclude_dirs,
+                &s.exclude_files,
+            );
+            if let Some(old) = s.root_node.as_ref().filter(|old| old.path == *dir) {
+                apply_collapsed_dirs(&mut scan.node, &collect_collapsed_dirs(old));
+            }
             let snap = gather_paths_set(&scan.node);
             (scan.node, snap, scan.stats)
         };
@@ -952,65 +1054,51 @@ pub fn rebuild_tree_and_ui(app: &AppWindow, state: &SharedState) {
             s.root_node = Some(root);
             s.existing_excluded_dirs = scan_stats.excluded_dirs_found;
             s.existing_excluded_files = scan_stats.excluded_files_found;
+            s.scanned_filters = Some(TreeFilters::snapshot(&s));
+            s.fs.needs_rescan = false;
+            // Supersede any background rescan still in flight.
+            s.rescan.seq = s.rescan.seq.wrapping_add(1);
             s.remove_regex = compile_remove_regex_opt(s.remove_regex_str.as_deref());
         }
     }
 
     refresh_flat_model(app, state);
 
-    // Detect presence of any .rs file to toggle Rust section visibility
-    let has_rs = {
-        let s = state.borrow();
-        let mut any = false;
-        if let Some(root) = &s.root_node {
-            fn rec(n: &Node, any: &mut bool) {
-                if *any {
-                    return;
-                }
-                if !n.is_dir && n.path.extension().and_then(|e| e.to_str()) == Some("rs") {
-                    *any = true;
-                    return;
-                }
-                for c in &n.children {
-                    rec(c, any);
-                }
-            }
-            rec(root, &mut any);
-        }
-        any
-    };
+    // Detect .rs / .slint files to toggle the language-specific sections
+    let (has_rs, has_slint) = state
+        .borrow()
+        .root_node
+        .as_ref()
+        .map_or((false, false), detect_language_files);
     app.set_show_rust_section(has_rs);
+    app.set_show_slint_section(has_slint);
     {
         let mut s = state.borrow_mut();
         s.rust_ui.has_files = has_rs;
+        s.slint_ui.has_files = has_slint;
     }
+}
 
-    // Detect presence of any .slint file to toggle Slint section visibility
-    let has_slint = {
-        let s = state.borrow();
-        let mut any = false;
-        if let Some(root) = &s.root_node {
-            fn rec(n: &Node, any: &mut bool) {
-                if *any {
-                    return;
-                }
-                if !n.is_dir && n.path.extension().and_then(|e| e.to_str()) == Some("slint") {
-                    *any = true;
-                    return;
-                }
-                for c in &n.children {
-                    rec(c, any);
-                }
-            }
-            rec(root, &mut any);
+/// Whether the tree holds any `.rs` / `.slint` files, found in one walk that
+/// stops as soon as both have been seen.
+fn detect_language_files(root: &Node) -> (bool, bool) {
+    let (mut has_rs, mut has_slint) = (false, false);
+    let mut stack = vec![root];
+    while let Some(n) = stack.pop() {
+        if n.is_dir {
+            stack.extend(&n.children);
+            continue;
+        }
+        match n.path.extension().and_then(|e| e.to_str()) {
+            Some("rs") => has_rs = true,
+            Some("slint") => has_slint = true,
+            _ => continue,
+        }
+        if has_rs && has_slint {
+            break;
         }
-        any
-    };
-    app.set_show_slint_section(has_slint);
-    {
-        let mut s = state.borrow_mut();
-        s.slint_ui.has_files = has_slint;
     }
+    (has_rs, has_slint)
 }
 
 fn refresh_flat_model(app: &AppWindow, state: &SharedState) {
@@ -1086,6 +1174,7 @@ fn parse_filters_from_ui(app: &AppWindow, state: &SharedState) {
     if let Some(profile_idx) = profile_vec_index(idx)
         && let mut local_settings = load_local_settings(&dir).unwrap_or_default()
         && let Some(meta) = state.borrow().profiles.get(profile_idx)
+        && local_settings.current_profile.as_deref() != Some(meta.name.as_str())
     {
         local_settings.current_profile = Some(meta.name.clone());
         let _ = save_local_settings(&dir, &local_settings);
@@ -1095,43 +1184,36 @@ fn parse_filters_from_ui(app: &AppWindow, state: &SharedState) {
 }
 
 fn toggle_node_expanded(state: &SharedState, path: &Path) -> bool {
-    fn rec(n: &mut Node, target: &Path) -> bool {
-        if n.path == target {
-            if n.is_dir {
-                n.expanded = !n.expanded;
-                return true;
-            }
+    let mut guard = state.borrow_mut();
+    let Some(mut node) = guard.root_node.as_mut() else {
+        return false;
+    };
+    // Follow the one child directory that contains the target at each level,
+    // so a click costs O(depth) instead of a search of the whole tree.
+    while node.path != path {
+        let Some(next) = node
+            .children
+            .iter_mut()
+            .find(|c| c.is_dir && path.starts_with(&c.path))
+        else {
             return false;
-        }
-        for c in &mut n.children {
-            if rec(c, target) {
-                return true;
-            }
-        }
-        false
+        };
+        node = next;
     }
-    if let Some(root) = state.borrow_mut().root_node.as_mut() {
-        return rec(root, path);
+    if !node.is_dir {
+        return false;
     }
-    false
+    node.expanded = !node.expanded;
+    true
 }
 
 fn clear_descendant_explicit_states(state: &SharedState, dir: &Path) {
-    let mut to_clear = Vec::new();
-    {
-        let s = state.borrow();
-        for p in s.explicit_states.keys() {
-            if is_ancestor_of(dir, p) && p != dir {
-                to_clear.push(p.clone());
-            }
-        }
-    }
-    if !to_clear.is_empty() {
-        let mut s = state.borrow_mut();
-        for p in to_clear {
-            s.explicit_states.remove(&p);
-        }
-    }
+    // Explicit keys and row paths both come from the scanned tree, so a lexical
+    // prefix check is enough; no need to canonicalize every key.
+    state
+        .borrow_mut()
+        .explicit_states
+        .retain(|p, _| p == dir || !p.starts_with(dir));
 }
 
 fn flatten_tree(
@@ -1140,13 +1222,9 @@ fn flatten_tree(
     inherited: Option<bool>,
     level: usize,
 ) -> Vec<Row> {
-    fn walk(
-        n: &Node,
-        explicit: &HashMap<PathBuf, bool>,
-        inherited: Option<bool>,
-        level: usize,
-        rows: &mut Vec<Row>,
-    ) {
+    let mut rows = Vec::new();
+    let mut stack: Vec<(&Node, Option<bool>, usize)> = vec![(root, inherited, level)];
+    while let Some((n, inherited, level)) = stack.pop() {
         let effective = explicit
             .get(&n.path)
             .copied()
@@ -1154,8 +1232,8 @@ fn flatten_tree(
             .unwrap_or(false);
         let has_children = !n.children.is_empty();
         rows.push(Row {
-            path: n.path.to_string_lossy().to_string().into(),
-            name: n.name.clone().into(),
+            path: n.path.to_string_lossy().as_ref().into(),
+            name: n.name.as_str().into(),
             level: i32::try_from(level).unwrap_or(i32::MAX),
             is_dir: n.is_dir,
             expanded: if n.is_dir { n.expanded } else { false },
@@ -1163,14 +1241,15 @@ fn flatten_tree(
             has_children,
         });
         if n.is_dir && n.expanded {
-            let next_inherited = effective;
-            for c in &n.children {
-                walk(c, explicit, Some(next_inherited), level + 1, rows);
-            }
+            // Pushed in reverse so children come off the stack in tree order.
+            stack.extend(
+                n.children
+                    .iter()
+                    .rev()
+                    .map(|c| (c, Some(effective), level + 1)),
+            );
         }
     }
-    let mut rows = Vec::new();
-    walk(root, explicit, inherited, level, &mut rows);
     rows
 }
 
@@ -1184,8 +1263,24 @@ fn get_row_by_index(app: &AppWindow, index: usize) -> Option<Row> {
 }
 
 fn set_tree_model(app: &AppWindow, rows: Vec<Row>) {
-    let model = VecModel::from(rows);
-    app.set_tree_model(ModelRc::new(model));
+    // Reuse the existing model and swap all rows in as a single reset. The reset
+    // matters: a clicked CheckBox assigns its own `checked`, dropping the
+    // `row.checked` binding, and only recreated delegates bind to it again.
+    // Per-row updates would leave such boxes showing a stale state. Identical
+    // rows (no-op refreshes) are skipped entirely.
+    let model = app.get_tree_model();
+    if let Some(vec_model) = model.as_any().downcast_ref::<VecModel<Row>>() {
+        let unchanged = vec_model.row_count() == rows.len()
+            && rows
+                .iter()
+                .enumerate()
+                .all(|(i, row)| vec_model.row_data(i).as_ref() == Some(row));
+        if !unchanged {
+            vec_model.set_vec(rows);
+        }
+        return;
+    }
+    app.set_tree_model(ModelRc::new(VecModel::from(rows)));
 }
 
 fn set_output(app: &AppWindow, state: &SharedState, s: &str) {
@@ -1302,45 +1397,171 @@ pub fn on_check_updates(app: &AppWindow, state: &SharedState) {
     if !should_scan {
         return;
     }
-    {
-        state.borrow_mut().fs.dirty = false;
+    let needs_rescan = {
+        let mut s = state.borrow_mut();
+        s.fs.dirty = false;
+        std::mem::take(&mut s.fs.needs_rescan)
+    };
+
+    // Fast path: only file contents changed, so the tree is still accurate and
+    // the output needs regenerating only if a selected file was touched.
+    if !needs_rescan {
+        if !app.get_dirs_only() && selected_files_modified(state) {
+            on_generate_output(app, state);
+        }
+        return;
     }
 
-    let (changed, new_scan, new_snapshot) = {
-        let s = state.borrow();
-        let include = s.include_exts.clone();
-        let exclude = s.exclude_exts.clone();
-        let ex_dirs = s.exclude_dirs.clone();
-        let ex_files = s.exclude_files.clone();
-        let dir = s.selected_directory.as_ref().unwrap().clone();
-
-        let scan = scan_dir_to_node_with_stats(&dir, &include, &exclude, &ex_dirs, &ex_files);
-        let fresh_snapshot = gather_paths_set(&scan.node);
-        let changed = s
-            .path_snapshot
-            .as_ref()
-            .is_none_or(|old| *old != fresh_snapshot);
-        (changed, scan, fresh_snapshot)
+    // The scan itself runs on a worker thread; results come back through the
+    // rescan pump. Events arriving meanwhile queue exactly one follow-up scan.
+    if state.borrow().rescan.in_progress {
+        state.borrow_mut().rescan.queue_another = true;
+        return;
+    }
+    start_background_rescan(app, state);
+}
+
+struct RescanJob {
+    dir: PathBuf,
+    filters: TreeFilters,
+    tx: mpsc::Sender<RescanOutcome>,
+    seq: u64,
+}
+
+fn start_background_rescan(app: &AppWindow, state: &SharedState) {
+    ensure_rescan_channel(app, state);
+
+    let job = {
+        let mut s = state.borrow_mut();
+        let (Some(dir), Some(tx)) = (s.selected_directory.clone(), s.rescan.result_tx.clone())
+        else {
+            return;
+        };
+        s.rescan.in_progress = true;
+        s.rescan.queue_another = false;
+        s.rescan.seq = s.rescan.seq.wrapping_add(1);
+        RescanJob {
+            dir,
+            filters: TreeFilters::snapshot(&s),
+            tx,
+            seq: s.rescan.seq,
+        }
     };
 
-    if changed {
-        {
+    std::thread::spawn(move || run_rescan_job(job));
+}
+
+fn run_rescan_job(job: RescanJob) {
+    let RescanJob {
+        dir,
+        filters,
+        tx,
+        seq,
+    } = job;
+
+    let scan = scan_dir_to_node_with_stats(
+        &dir,
+        &filters.include_exts,
+        &filters.exclude_exts,
+        &filters.exclude_dirs,
+        &filters.exclude_files,
+    );
+    let snapshot = gather_paths_set(&scan.node);
+    let _ = tx.send(RescanOutcome {
+        seq,
+        node: scan.node,
+        snapshot,
+        stats: scan.stats,
+        filters,
+    });
+}
+
+fn ensure_rescan_channel(app: &AppWindow, state: &SharedState) {
+    let mut s = state.borrow_mut();
+    if s.rescan.result_tx.is_some() && s.rescan.result_rx.is_some() {
+        return;
+    }
+
+    let (tx, rx) = mpsc::channel::<RescanOutcome>();
+    s.rescan.result_tx = Some(tx);
+    s.rescan.result_rx = Some(rx);
+
+    let app_weak = app.as_weak();
+    let state_rc = state.clone();
+    s.rescan.pump_timer.start(
+        slint::TimerMode::Repeated,
+        std::time::Duration::from_millis(120),
+        move || {
+            let latest = {
+                let st = state_rc.borrow();
+                st.rescan
+                    .result_rx
+                    .as_ref()
+                    .and_then(|rx| rx.try_iter().last())
+            };
+            if let (Some(app), Some(outcome)) = (app_weak.upgrade(), latest) {
+                apply_rescan_outcome(&app, &state_rc, outcome);
+            }
+        },
+    );
+}
+
+fn apply_rescan_outcome(app: &AppWindow, state: &SharedState, outcome: RescanOutcome) {
+    // Any rescan started after this one (including a synchronous rebuild for a
+    // filter or profile change) bumps the sequence and makes this result stale.
+    let current = {
+        let mut s = state.borrow_mut();
+        s.rescan.in_progress = false;
+        outcome.seq == s.rescan.seq
+    };
+
+    if current {
+        let RescanOutcome {
+            mut node,
+            snapshot,
+            stats,
+            filters,
+            ..
+        } = outcome;
+        let changed = {
             let mut s = state.borrow_mut();
-            s.root_node = Some(new_scan.node.clone());
-            s.path_snapshot = Some(new_snapshot);
-            s.existing_excluded_dirs = new_scan.stats.excluded_dirs_found;
-            s.existing_excluded_files = new_scan.stats.excluded_files_found;
+            // The tree now reflects the filters this scan used (identical
+            // paths included), which may differ from an older rebuild's.
+            s.scanned_filters = Some(filters);
+            s.path_snapshot.as_ref().is_none_or(|old| *old != snapshot)
+        };
+
+        if changed {
+            {
+                let mut s = state.borrow_mut();
+                if let Some(old) = s.root_node.as_ref().filter(|old| old.path == node.path) {
+                    apply_collapsed_dirs(&mut node, &collect_collapsed_dirs(old));
+                }
+                s.root_node = Some(node);
+                s.path_snapshot = Some(snapshot);
+                s.existing_excluded_dirs = stats.excluded_dirs_found;
+                s.existing_excluded_files = stats.excluded_files_found;
+            }
+            refresh_flat_model(app, state);
+        } else if !app.get_dirs_only() {
+            on_generate_output(app, state);
         }
-        refresh_flat_model(app, state);
-        return;
     }
 
-    let want_dirs_only = app.get_dirs_only();
-    if !want_dirs_only {
-        on_generate_output(app, state);
+    let again = std::mem::take(&mut state.borrow_mut().rescan.queue_another);
+    if again {
+        start_background_rescan(app, state);
     }
 }
 
+/// Whether any file recorded at the last generation has a different mtime now.
+fn selected_files_modified(state: &SharedState) -> bool {
+    let s = state.borrow();
+    s.last_mod_times
+        .iter()
+        .any(|(fp, recorded)| fs::metadata(fp).ok().and_then(|m| m.modified().ok()) != *recorded)
+}
+
 fn start_fs_watcher(app: &AppWindow, state: &SharedState) -> notify::Result<()> {
     {
         let mut s = state.borrow_mut();
@@ -1373,46 +1594,47 @@ fn start_fs_watcher(app: &AppWindow, state: &SharedState) -> notify::Result<()>
             std::time::Duration::from_millis(250),
             move || {
                 if let Some(app) = app_weak.upgrade() {
-                    let any_relevant = {
+                    let (any_relevant, any_structural) = {
                         let s = state_rc.borrow();
                         let Some(rx_ref) = s.fs_event_rx.as_ref() else {
                             return;
                         };
 
-                        // Snapshot current filters
-                        let project_root = match &s.selected_directory {
-                            Some(p) => p.clone(),
-                            None => return,
+                        // Filters stay borrowed for the drain; nothing is copied per tick.
+                        let Some(project_root) = s.selected_directory.as_deref() else {
+                            return;
                         };
-                        let include_exts = s.include_exts.clone();
-                        let exclude_exts = s.exclude_exts.clone();
-                        let exclude_dirs = s.exclude_dirs.clone();
-                        let exclude_files = s.exclude_files.clone();
 
                         // Drain and check relevance with the shared helper
                         let mut relevant = false;
+                        let mut structural = false;
                         while let Ok(ev_res) = rx_ref.try_recv() {
                             if let Ok(ev) = ev_res {
-                                for p in ev.paths {
-                                    if stitch::core::is_event_path_relevant(
-                                        &project_root,
-                                        &p,
-                                        &include_exts,
-                                        &exclude_exts,
-                                        &exclude_dirs,
-                                        &exclude_files,
-                                    ) {
-                                        relevant = true;
-                                        break;
-                                    }
+                                let ev_relevant = ev.paths.iter().any(|p| {
+                                    stitch::core::is_event_path_relevant(
+                                        project_root,
+                                        p,
+                                        &s.include_exts,
+                                        &s.exclude_exts,
+                                        &s.exclude_dirs,
+                                        &s.exclude_files,
+                                    )
+                                });
+                                if ev_relevant {
+                                    relevant = true;
+                                    structural |= stitch::core::is_structural_event_kind(&ev.kind);
                                 }
                             }
                         }
-                        relevant
+                        (relevant, structural)
                     };
 
                     if any_relevant {
-                        state_rc.borrow_mut().fs.dirty = true;
+                        {
+                            let mut s = state_rc.borrow_mut();
+                            s.fs.dirty = true;
+                            s.fs.needs_rescan |= any_structural;
+                        }
                         on_check_updates(&app, &state_rc);
                     }
                 }
@@ -11,9 +11,39 @@ use std::{
 #[derive(Default)]
 pub struct FsState {
     pub dirty: bool,
+    /// Set when a pending event may have added, removed or renamed entries;
+    /// otherwise only file contents changed and the tree can be kept.
+    pub needs_rescan: bool,
     pub watcher_disabled: bool,
 }
 
+/// Output of a generation job, with the modification time of every file it read.
+pub struct GenerationOutcome {
+    pub seq: u64,
+    pub output: String,
+    pub mod_times: Vec<(PathBuf, Option<SystemTime>)>,
+}
+
+/// Result of a background rescan, tagged with the sequence number it was started with.
+pub struct RescanOutcome {
+    pub seq: u64,
+    pub node: stitch::core::Node,
+    pub snapshot: HashSet<PathBuf>,
+    pub stats: stitch::core::ScanStats,
+    /// Filters the scan ran with; they become `scanned_filters` once applied.
+    pub filters: TreeFilters,
+}
+
+#[derive(Default)]
+pub struct RescanState {
+    pub in_progress: bool,
+    pub queue_another: bool,
+    pub seq: u64,
+    pub result_tx: Option<mpsc::Sender<RescanOutcome>>,
+    pub result_rx: Option<mpsc::Receiver<RescanOutcome>>,
+    pub pump_timer: slint::Timer,
+}
+
 #[derive(Default)]
 pub struct GenerationState {
     pub in_progress: bool,
@@ -51,6 +81,36 @@ impl CommentRemoval {
     }
 }
 
+/// Filter sets a tree scan was performed with. Filter edits that leave these
+/// unchanged (remove-prefix, remove-regex, language toggles) can skip the rescan.
+#[derive(Default, PartialEq, Eq)]
+pub struct TreeFilters {
+    pub include_exts: HashSet<String>,
+    pub exclude_exts: HashSet<String>,
+    pub exclude_dirs: HashSet<String>,
+    pub exclude_files: HashSet<String>,
+}
+
+impl TreeFilters {
+    #[must_use]
+    pub fn snapshot(s: &AppState) -> Self {
+        Self {
+            include_exts: s.include_exts.clone(),
+            exclude_exts: s.exclude_exts.clone(),
+            exclude_dirs: s.exclude_dirs.clone(),
+            exclude_files: s.exclude_files.clone(),
+        }
+    }
+
+    #[must_use]
+    pub fn matches(&self, s: &AppState) -> bool {
+        self.include_exts == s.include_exts
+            && self.exclude_exts == s.exclude_exts
+            && self.exclude_dirs == s.exclude_dirs
+            && self.exclude_files == s.exclude_files
+    }
+}
+
 #[derive(Default)]
 pub struct RustUiState {
     pub has_files: bool,
@@ -82,9 +142,12 @@ pub struct AppState {
     pub exclude_files: HashSet<String>,
     pub existing_excluded_dirs: HashSet<String>,
     pub existing_excluded_files: HashSet<String>,
+    pub scanned_filters: Option<TreeFilters>,
+    pub filter_debounce_timer: slint::Timer,
     pub copy_toast_timer: slint::Timer,
     pub select_dialog: Option<crate::ui::SelectFromTextDialog>,
     pub fs: FsState,
+    pub rescan: RescanState,
     pub watcher: Option<notify::RecommendedWatcher>,
     pub fs_event_rx: Option<std::sync::mpsc::Receiver<notify::Result<notify::Event>>>,
     pub fs_pump_timer: slint::Timer,
@@ -102,8 +165,8 @@ pub struct AppState {
 
     pub generation: GenerationState,
     pub gen_seq: u64,
-    pub gen_result_tx: Option<mpsc::Sender<(u64, String)>>,
-    pub gen_result_rx: Option<mpsc::Receiver<(u64, String)>>,
+    pub gen_result_tx: Option<mpsc::Sender<GenerationOutcome>>,
+    pub gen_result_rx: Option<mpsc::Receiver<GenerationOutcome>>,
     pub gen_pump_timer: slint::Timer,
     // Rust-specific filters and detection
     pub rust_ui: RustUiState,
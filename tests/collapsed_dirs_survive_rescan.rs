@@ -0,0 +1,57 @@
+use std::collections::HashSet;
+use std::fs;
+use stitch::core::*;
+use tempfile::TempDir;
+
+fn scan(root: &std::path::Path) -> Node {
+    let none: HashSet<String> = HashSet::new();
+    scan_dir_to_node(root, &none, &none, &none, &none)
+}
+
+fn find<'a>(n: &'a Node, name: &str) -> &'a Node {
+    n.children.iter().find(|c| c.name == name).unwrap()
+}
+
+#[test]
+fn collapsed_dirs_are_restored_on_rescan() {
+    let tmp = TempDir::new().unwrap();
+    let root = tmp.path();
+
+    fs::create_dir_all(root.join("a/inner")).unwrap();
+    fs::create_dir_all(root.join("b")).unwrap();
+    fs::write(root.join("a/inner/x.rs"), "x").unwrap();
+    fs::write(root.join("b/y.rs"), "y").unwrap();
+
+    let mut first = scan(root);
+    first
+        .children
+        .iter_mut()
+        .find(|c| c.name == "a")
+        .unwrap()
+        .expanded = false;
+
+    let collapsed = collect_collapsed_dirs(&first);
+    assert_eq!(collapsed.len(), 1);
+    assert!(collapsed.contains(&root.join("a")));
+
+    // A new file shows up; the fresh scan comes back fully expanded.
+    fs::write(root.join("b/z.rs"), "z").unwrap();
+    let mut second = scan(root);
+    assert!(find(&second, "a").expanded);
+
+    apply_collapsed_dirs(&mut second, &collapsed);
+    assert!(!find(&second, "a").expanded);
+    assert!(find(find(&second, "a"), "inner").expanded);
+    assert!(find(&second, "b").expanded);
+    assert_eq!(find(&second, "b").children.len(), 2);
+}
+
+#[test]
+fn fully_expanded_tree_has_no_collapsed_dirs() {
+    let tmp = TempDir::new().unwrap();
+    let root = tmp.path();
+    fs::create_dir_all(root.join("a/b")).unwrap();
+    fs::write(root.join("a/b/f.txt"), "f").unwrap();
+
+    assert!(collect_collapsed_dirs(&scan(root)).is_empty());
+}
@@ -0,0 +1,33 @@
+use notify::EventKind;
+use notify::event::{
+    AccessKind, CreateKind, DataChange, MetadataKind, ModifyKind, RemoveKind, RenameMode,
+};
+
+use stitch::core::is_structural_event_kind;
+
+#[test]
+fn content_and_metadata_changes_are_not_structural() {
+    for kind in [
+        EventKind::Modify(ModifyKind::Data(DataChange::Content)),
+        EventKind::Modify(ModifyKind::Data(DataChange::Any)),
+        EventKind::Modify(ModifyKind::Metadata(MetadataKind::WriteTime)),
+        EventKind::Access(AccessKind::Any),
+    ] {
+        assert!(!is_structural_event_kind(&kind), "{kind:?}");
+    }
+}
+
+#[test]
+fn create_remove_rename_and_unknown_are_structural() {
+    for kind in [
+        EventKind::Create(CreateKind::File),
+        EventKind::Remove(RemoveKind::Folder),
+        EventKind::Modify(ModifyKind::Name(RenameMode::Both)),
+        // Backends that cannot classify a modification must still trigger a rescan.
+        EventKind::Modify(ModifyKind::Any),
+        EventKind::Any,
+        EventKind::Other,
+    ] {
+        assert!(is_structural_event_kind(&kind), "{kind:?}");
+    }
+}
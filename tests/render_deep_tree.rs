@@ -0,0 +1,18 @@
+use stitch::core::render_unicode_tree_from_paths;
+
+#[test]
+fn render_handles_deep_nesting() {
+    let depth = 1000;
+    let path = (0..depth)
+        .map(|i| format!("d{i}"))
+        .collect::<Vec<_>>()
+        .join("/");
+    let out = render_unicode_tree_from_paths(&[path], Some("root"));
+
+    let lines: Vec<&str> = out.lines().collect();
+    assert_eq!(lines.len(), depth + 1);
+    assert_eq!(lines[0], "root");
+    assert_eq!(lines[1], "└── d0");
+    let last = format!("{}└── d{}", "    ".repeat(depth - 1), depth - 1);
+    assert_eq!(lines[depth], last);
+}
@@ -0,0 +1,41 @@
+use std::collections::HashSet;
+use std::fs;
+use stitch::core::{collect_wanted_files, parse_hierarchy_text, scan_dir_to_node};
+use tempfile::TempDir;
+
+fn scan(root: &std::path::Path) -> stitch::core::Node {
+    let h = HashSet::new();
+    scan_dir_to_node(root, &h, &h, &h, &h)
+}
+
+#[test]
+fn flat_path_list_selects_nested_files() {
+    let tmp = TempDir::new().unwrap();
+    let root = tmp.path();
+    fs::create_dir_all(root.join("src")).unwrap();
+    fs::write(root.join("src/a.rs"), "x").unwrap();
+    fs::write(root.join("src/b.rs"), "x").unwrap();
+
+    let wanted = parse_hierarchy_text("root\nsrc/a.rs").unwrap();
+    let files = collect_wanted_files(&scan(root), &wanted);
+    assert_eq!(files, vec![root.join("src/a.rs")]);
+}
+
+#[test]
+fn full_tree_selects_only_listed_files() {
+    let tmp = TempDir::new().unwrap();
+    let root = tmp.path();
+    fs::create_dir_all(root.join("src/core")).unwrap();
+    fs::write(root.join("src/core/fs.rs"), "x").unwrap();
+    fs::write(root.join("src/core/text.rs"), "x").unwrap();
+    fs::write(root.join("README.md"), "x").unwrap();
+
+    let text = "root\n├── src\n│   └── core\n│       └── fs.rs\n└── README.md\n";
+    let wanted = parse_hierarchy_text(text).unwrap();
+    let mut files = collect_wanted_files(&scan(root), &wanted);
+    files.sort();
+    assert_eq!(
+        files,
+        vec![root.join("README.md"), root.join("src/core/fs.rs")]
+    );
+}
@@ -57,3 +57,61 @@ fn explicit_false_on_dir_blocks_descendants_even_if_parent_selected() {
         "explicitly-false dir should not appear"
     );
 }
+
+#[test]
+fn explicit_true_deep_inside_unselected_subtree_is_collected() {
+    // root/
+    //   big/
+    //     x/y/wanted.txt   <- explicitly selected
+    //     x/other.txt
+    //   untouched/
+    //     c.txt
+    let tmp = TempDir::new().unwrap();
+    let root = tmp.path();
+    mkfile(&root.join("big/x/y/wanted.txt"));
+    mkfile(&root.join("big/x/other.txt"));
+    mkfile(&root.join("untouched/c.txt"));
+
+    let none: HashSet<String> = HashSet::new();
+    let tree = scan_dir_to_node(root, &none, &none, &none, &none);
+
+    let mut explicit: HashMap<PathBuf, bool> = HashMap::new();
+    explicit.insert(root.join("big/x/y/wanted.txt"), true);
+
+    let mut files = Vec::new();
+    let mut dirs = Vec::new();
+    collect_selected_paths(&tree, &explicit, None, &mut files, &mut dirs);
+
+    let files_unix: Vec<_> = files.iter().map(|p| path_to_unix(p)).collect();
+    assert_eq!(
+        files_unix.len(),
+        1,
+        "only the explicit file: {files_unix:?}"
+    );
+    assert!(files_unix[0].ends_with("big/x/y/wanted.txt"));
+    assert!(dirs.is_empty(), "no directory is selected: {dirs:?}");
+}
+
+#[test]
+fn explicit_true_inside_explicit_false_dir_is_collected() {
+    let tmp = TempDir::new().unwrap();
+    let root = tmp.path();
+    mkfile(&root.join("drop/keep_me.txt"));
+    mkfile(&root.join("drop/b.txt"));
+
+    let none: HashSet<String> = HashSet::new();
+    let tree = scan_dir_to_node(root, &none, &none, &none, &none);
+
+    let mut explicit: HashMap<PathBuf, bool> = HashMap::new();
+    explicit.insert(root.to_path_buf(), true);
+    explicit.insert(root.join("drop"), false);
+    explicit.insert(root.join("drop/keep_me.txt"), true);
+
+    let mut files = Vec::new();
+    let mut dirs = Vec::new();
+    collect_selected_paths(&tree, &explicit, None, &mut files, &mut dirs);
+
+    let files_unix: Vec<_> = files.iter().map(|p| path_to_unix(p)).collect();
+    assert!(files_unix.iter().any(|s| s.ends_with("drop/keep_me.txt")));
+    assert!(!files_unix.iter().any(|s| s.ends_with("drop/b.txt")));
+}